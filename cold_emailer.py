@@ -19,37 +19,305 @@ import ssl
 import json
 import csv
 import time
+import signal
+import threading
+import contextlib
+import multiprocessing
 import random
 import logging
+import logging.handlers
+import re
+import string
+import functools
+from collections import deque, namedtuple
+from itertools import islice
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
+from email.generator import BytesGenerator
+from email.policy import compat32
+from io import BytesIO
 from datetime import datetime
 import argparse
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import sys
 
 # Configure logging
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_log_file_handler = logging.FileHandler('cold_emailer.log', encoding='utf-8')
+_log_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+# Batch writes to the log file; errors are still written immediately
+_log_buffer = logging.handlers.MemoryHandler(capacity=100, target=_log_file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler('cold_emailer.log'),
+        _log_buffer,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Used to make URLs in the HTML version of an email clickable
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+_LINK_REPL = r'<a href="\1" style="color: #0066cc; text-decoration: underline;">\1</a>'
+# How messages are serialized for sendmail(): the same output as
+# Message.as_string(), but with the CRLF line endings SMTP expects
+_WIRE_POLICY = compat32.clone(linesep='\r\n')
+# Splits text into its leading word, the middle, and its trailing word
+_EDGE_WORDS_RE = re.compile(r'(\S*)(.*?)(\S*)\Z', re.S)
+# The column name at the start of a placeholder like {name[0]} or {name.attr}
+_FIELD_BASE_RE = re.compile(r'[^.\[]*')
+
+def _placeholder_names(template: str) -> set:
+    """Return the column names a str.format() template refers to.
+    
+    Includes placeholders nested in format specs, like the width in {name:{width}}.
+    """
+    names = set()
+    for _, field_name, format_spec, _ in string.Formatter().parse(template):
+        if field_name is None:
+            continue
+        name = _FIELD_BASE_RE.match(field_name).group()
+        if not name or name.isdigit():
+            raise ValueError(
+                "Positional placeholders like {} or {0} are not supported in templates; "
+                "use a column name such as {first_name}"
+            )
+        names.add(name)
+        if format_spec:
+            names |= _placeholder_names(format_spec)
+    return names
+
+def _to_html(text: str) -> str:
+    """Convert plain text to HTML with clickable links and line breaks."""
+    # Linkify before adding <br> so a URL at the end of a line stops there
+    return _URL_RE.sub(_LINK_REPL, text).replace('\n', '<br>')
+
+class _CompiledTemplate:
+    """A str.format() template parsed once and rendered once per recipient.
+    
+    Placeholders are resolved to column positions in the recipients CSV up
+    front, so rendering indexes straight into each row.
+    """
+    
+    _formatter = string.Formatter()
+    
+    def __init__(self, template: str, fieldnames: List[str]):
+        self.fieldnames = fieldnames
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        # (literal_text, column, field_name, format_spec, conversion) tuples;
+        # column is None only for the trailing literal
+        self.segments = []
+        pending = ''
+        for literal, field_name, format_spec, conversion in self._formatter.parse(template):
+            if field_name is None:
+                # Escaped braces split the literal text; glue it back together
+                pending += literal
+                continue
+            column = columns[_FIELD_BASE_RE.match(field_name).group()]
+            if '{' in format_spec:
+                # The spec has placeholders of its own, like {name:{width}}
+                format_spec = _CompiledTemplate(format_spec, fieldnames)
+            self.segments.append((pending + literal, column, field_name, format_spec, conversion))
+            pending = ''
+        if pending:
+            self.segments.append((pending, None, None, None, None))
+    
+    def render(self, row: tuple) -> str:
+        """Render the template, equivalent to template.format(**row_as_dict)."""
+        return self._render(self.segments, row)
+    
+    def _render(self, segments: List[tuple], row: tuple) -> str:
+        parts = []
+        for literal, column, field_name, format_spec, conversion in segments:
+            parts.append(literal)
+            if column is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                # Rare forms like {name!r}, {name:>10} or {name[0]}
+                values = {self.fieldnames[column]: row[column]}
+                value = self._formatter.get_field(field_name, (), values)[0]
+                value = self._formatter.convert_field(value, conversion)
+                if not isinstance(format_spec, str):
+                    format_spec = format_spec.render(row)
+                parts.append(self._formatter.format_field(value, format_spec))
+            else:
+                parts.append(row[column])
+        return ''.join(parts)
+
+class _CompiledHtmlTemplate(_CompiledTemplate):
+    """The HTML version of a body template.
+    
+    URLs never span whitespace, so any literal text separated from the
+    placeholders by whitespace is converted to HTML once, up front. Only the
+    words touching a placeholder are converted again for each recipient.
+    """
+    
+    def __init__(self, template: str, fieldnames: List[str]):
+        super().__init__(template, fieldnames)
+        # Each part is either finished HTML or a run of segments that still
+        # has to be rendered and converted for each recipient
+        self.parts = []
+        run = []
+        for segment in self.segments:
+            literal, column = segment[:2]
+            has_space = any(c.isspace() for c in literal)
+            if run:
+                if not has_space:
+                    # No word break, so this text belongs to the open run
+                    run.append(segment)
+                    continue
+                head, lead, tail = _EDGE_WORDS_RE.match(literal).groups()
+                if head:
+                    run.append((head, None, None, None, None))
+                self.parts.append(run)
+                run = []
+            elif column is None:
+                self._add_static(literal)
+                continue
+            elif has_space:
+                head, middle, tail = _EDGE_WORDS_RE.match(literal).groups()
+                lead = head + middle
+            else:
+                lead, tail = '', literal
+            
+            self._add_static(lead)
+            if column is None:
+                self._add_static(tail)
+            else:
+                run = [(tail,) + segment[1:]]
+        if run:
+            self.parts.append(run)
+    
+    def _add_static(self, text: str):
+        if not text:
+            return
+        html = _to_html(text)
+        if self.parts and isinstance(self.parts[-1], str):
+            self.parts[-1] += html
+        else:
+            self.parts.append(html)
+    
+    def render(self, row: tuple) -> str:
+        """Render the template as HTML, equivalent to _to_html() of the plain text."""
+        return ''.join(
+            part if isinstance(part, str) else _to_html(self._render(part, row))
+            for part in self.parts
+        )
+
+class _RateLimiter:
+    """Paces sends with a random gap between emails and a rolling hourly cap."""
+    
+    def __init__(self, min_delay: float, max_delay: float, max_per_hour: int,
+                 stop: threading.Event):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_per_hour = max_per_hour
+        # Set to cut a wait short when the campaign is stopped
+        self._stop = stop
+        # Start times of the emails sent within the last hour, oldest first
+        self._sent = deque()
+    
+    def wait(self, count: int = 1) -> bool:
+        """Block until the next count emails may be sent and record them as sent.
+        
+        Returns False, without waiting any longer, once the campaign is stopped.
+        """
+        if self._sent:
+            now = time.monotonic()
+            # The gap counts from when the previous email started, so time
+            # spent talking to the SMTP server overlaps the wait
+            delay = self._sent[-1] + random.uniform(self.min_delay, self.max_delay) - now
+            reason = "before next email"
+            over = len(self._sent) + count - self.max_per_hour
+            if over > 0:
+                # Wait until enough of the oldest sends are an hour old
+                hourly_delay = self._sent[over - 1] + 3600 - now
+                if hourly_delay > delay:
+                    delay = hourly_delay
+                    reason = f"for hourly limit ({self.max_per_hour})"
+            if delay > 0:
+                logger.info("Waiting %.1f seconds %s...", delay, reason)
+                self._stop.wait(delay)
+        
+        if self._stop.is_set():
+            return False
+        self._sent.extend([time.monotonic()] * count)
+        while len(self._sent) > self.max_per_hour:
+            self._sent.popleft()
+        return True
+
+class _RecipientReader:
+    """Reads recipients from a CSV file one row at a time.
+    
+    Rows are namedtuples in header order; fieldnames holds the header so
+    templates can be resolved to column positions before the first row.
+    """
+    
+    def __init__(self, recipients_file: str):
+        self._file = open(recipients_file, 'r', encoding='utf-8', newline='')
+        try:
+            self._reader = csv.reader(self._file)
+            self.fieldnames = next(self._reader, [])
+            # rename=True keeps headers that aren't valid identifiers working
+            self._row_type = namedtuple('Recipient', self.fieldnames, rename=True)
+        except Exception:
+            self._file.close()
+            raise
+    
+    def __iter__(self) -> Iterator[tuple]:
+        width = len(self.fieldnames)
+        make_row = self._row_type._make
+        for row in self._reader:
+            if not row:
+                continue  # Blank line
+            if len(row) != width:
+                if len(row) > width:
+                    logger.warning("Line %d has %d fields, expected %d; extra fields ignored",
+                                   self._reader.line_num, len(row), width)
+                row = (row + [''] * width)[:width]
+            yield make_row(row)
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 class ColdEmailer:
-    def __init__(self, config_file: str):
-        """Initialize the cold emailer with configuration."""
+    def __init__(self, config_file: str, account_index: Optional[int] = None):
+        """Initialize the cold emailer with configuration.
+        
+        account_index binds the emailer to one of several configured sender
+        accounts; it is set for the worker processes of a multi-account campaign.
+        """
+        self.config_file = config_file
         self.config = self.load_config(config_file)
+        self.account_index = account_index
+        self.accounts = []
         self.smtp_server = None
         self.smtp_port = None
+        self.smtp_timeout = None
         self.sender_email = None
         self.sender_password = None
+        self._smtp = None
+        self._connection_sends = 0
+        # Loading the CA bundle is costly; share one context across reconnects
+        self._ssl_ctx = ssl.create_default_context()
+        self._stop = threading.Event()
+        self._subject_tmpl = None
+        self._body_tmpl = None
+        self._html_tmpl = None
+        self._body_columns = []
+        self._render_message = None
+        self._personalized = True
+        self._email_index = None
         self.setup_smtp()
         
     def load_config(self, config_file: str) -> Dict:
@@ -57,160 +325,422 @@ class ColdEmailer:
         try:
             with open(config_file, 'r') as f:
                 config = json.load(f)
-            logger.info(f"Configuration loaded from {config_file}")
+            logger.info("Configuration loaded from %s", config_file)
             return config
         except FileNotFoundError:
-            logger.error(f"Configuration file {config_file} not found")
+            logger.error("Configuration file %s not found", config_file)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in configuration file: {e}")
+            logger.error("Invalid JSON in configuration file: %s", e)
             raise
     
     def setup_smtp(self):
         """Setup SMTP connection details."""
         email_config = self.config.get('email', {})
-        self.smtp_server = email_config.get('smtp_server')
-        self.smtp_port = email_config.get('smtp_port', 587)
-        self.sender_email = email_config.get('sender_email')
-        self.sender_password = email_config.get('sender_password')
+        # Either a single sender_email/sender_password pair or a list of
+        # accounts, each of which may override smtp_server and smtp_port
+        self.accounts = [
+            {
+                'smtp_server': account.get('smtp_server', email_config.get('smtp_server')),
+                'smtp_port': account.get('smtp_port', email_config.get('smtp_port', 587)),
+                'sender_email': account.get('sender_email'),
+                'sender_password': account.get('sender_password'),
+            }
+            for account in email_config.get('accounts') or [email_config]
+        ]
+        for account in self.accounts:
+            if not all([account['smtp_server'], account['sender_email'], account['sender_password']]):
+                raise ValueError("Missing required email configuration")
         
-        if not all([self.smtp_server, self.sender_email, self.sender_password]):
-            raise ValueError("Missing required email configuration")
+        account = self.accounts[self.account_index or 0]
+        self.smtp_server = account['smtp_server']
+        self.smtp_port = account['smtp_port']
+        # Seconds to wait on any single SMTP operation before giving up
+        self.smtp_timeout = email_config.get('timeout_seconds', 60)
+        self.sender_email = account['sender_email']
+        self.sender_password = account['sender_password']
     
-    def create_email_message(self, recipient: Dict, template: Dict) -> MIMEMultipart:
-        """Create an email message with personalization."""
-        msg = MIMEMultipart('alternative')
-        msg['From'] = self.sender_email
-        msg['To'] = recipient['email']
-        msg['Subject'] = self.personalize_subject(template['subject'], recipient)
+    def compile_template(self, template: Dict, fieldnames: List[str]):
+        """Parse the subject and body templates once for the whole campaign."""
+        if not template.get('subject') or not template.get('body'):
+            raise ValueError("Email template must include 'subject' and 'body'")
+        
+        # Fail before anything is sent rather than on every row
+        required = {'email'} | _placeholder_names(template['subject']) | _placeholder_names(template['body'])
+        missing = required.difference(fieldnames)
+        if missing:
+            raise ValueError(
+                f"Recipients file is missing column(s) used by the template: {', '.join(sorted(missing))}"
+            )
         
-        # Personalize the email body
-        personalized_body = self.personalize_body(template['body'], recipient)
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        self._email_index = columns['email']
+        self._subject_tmpl = _CompiledTemplate(template['subject'], fieldnames)
+        
+        # Many recipients share the values the body uses (sender details,
+        # industry, ...), so the body is compiled against just those columns
+        # and each distinct message is built and serialized only once
+        body = template['body']
+        body_fields = sorted(_placeholder_names(body))
+        self._body_columns = [columns[name] for name in body_fields]
+        self._body_tmpl = _CompiledTemplate(body, body_fields)
+        self._html_tmpl = _CompiledHtmlTemplate(body, body_fields)
+        self._render_message = functools.lru_cache(maxsize=1024)(self._build_message)
+        
+        self._personalized = bool(body_fields) or any(
+            segment[1] is not None for segment in self._subject_tmpl.segments
+        )
+    
+    def _build_message(self, subject: str, body_values: tuple) -> bytes:
+        """Build and serialize an email, minus its To header.
         
-        # Create both plain text and HTML versions
-        text_part = MIMEText(personalized_body, 'plain', 'utf-8')
+        body_values are the values of the body's columns. Recipients are
+        addressed by prepending a To header to the cached bytes.
+        """
+        personalized_body = self._body_tmpl.render(body_values)
         
-        # Create HTML version with clickable links
-        html_body = personalized_body.replace('\n', '<br>')
-        # Make URLs clickable
-        import re
-        html_body = re.sub(r'(https?://[^\s]+)', r'<a href="\1" style="color: #0066cc; text-decoration: underline;">\1</a>', html_body)
+        # The HTML version only adds clickable links and line breaks; a body
+        # that renders to one line without URLs is sent as plain text alone
+        if '\n' not in personalized_body and not _URL_RE.search(personalized_body):
+            msg = MIMEText(personalized_body, 'plain', 'utf-8')
+        else:
+            msg = MIMEMultipart('alternative')
+            
+            # Create both plain text and HTML versions
+            text_part = MIMEText(personalized_body, 'plain', 'utf-8')
+            
+            # Create HTML version with clickable links
+            html_body = self._html_tmpl.render(body_values)
+            html_part = MIMEText(html_body, 'html', 'utf-8')
+            
+            msg.attach(text_part)
+            msg.attach(html_part)
         
-        html_part = MIMEText(html_body, 'html', 'utf-8')
+        msg['From'] = self.sender_email
+        msg['Subject'] = subject
         
-        msg.attach(text_part)
-        msg.attach(html_part)
+        buf = BytesIO()
+        BytesGenerator(buf, policy=_WIRE_POLICY).flatten(msg)
+        return buf.getvalue()
+    
+    def create_email_message(self, recipient: tuple, to_addr: Optional[str] = None) -> bytes:
+        """Create the serialized email for a recipient, ready for sendmail().
         
-        return msg
+        The message is addressed to the recipient's email column unless
+        to_addr is given.
+        """
+        if to_addr is None:
+            to_addr = recipient[self._email_index]
+        message = self._render_message(
+            self._subject_tmpl.render(recipient),
+            tuple(recipient[column] for column in self._body_columns),
+        )
+        if to_addr.isascii():
+            to_header = _WIRE_POLICY.fold_binary('To', to_addr)
+        else:
+            # Sent with SMTPUTF8, where the address goes out as raw UTF-8
+            to_header = f'To: {to_addr}\r\n'.encode('utf-8')
+        return to_header + message
     
-    def personalize_subject(self, subject_template: str, recipient: Dict) -> str:
-        """Personalize the email subject line."""
-        return subject_template.format(**recipient)
+    def _connect(self):
+        """Open an authenticated SMTP session and keep it for reuse."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+        try:
+            server.starttls(context=self._ssl_ctx)
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._connection_sends = 0
+        logger.info("Connected to SMTP server %s:%s", self.smtp_server, self.smtp_port)
     
-    def personalize_body(self, body_template: str, recipient: Dict) -> str:
-        """Personalize the email body with recipient data."""
-        return body_template.format(**recipient)
+    def _reconnect(self):
+        """Drop the current SMTP session and open a fresh one."""
+        self.close()
+        self._connect()
     
-    def send_email(self, msg: MIMEMultipart) -> bool:
-        """Send a single email."""
+    def close(self):
+        """Close the SMTP session, if one is open."""
+        if self._smtp is None:
+            return
         try:
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                
-                text = msg.as_string()
-                server.sendmail(self.sender_email, msg['To'], text)
-                
-                logger.info(f"Email sent successfully to {msg['To']}")
-                return True
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            # The server may already have dropped the connection
+            self._smtp.close()
+        self._smtp = None
+    
+    def _deliver(self, message: bytes, to_addrs) -> Dict:
+        """Send message over the persistent SMTP session and return refused recipients."""
+        if self._smtp is None:
+            self._connect()
+        
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        # Like send_message(): non-ASCII addresses need the SMTPUTF8 extension
+        mail_options = ()
+        if not all(addr.isascii() for addr in [self.sender_email, *to_addrs]):
+            if not self._smtp.has_extn('smtputf8'):
+                raise smtplib.SMTPNotSupportedError(
+                    "Internationalized email addresses require a server with SMTPUTF8 support"
+                )
+            mail_options = ('SMTPUTF8', 'BODY=8BITMIME')
+        
+        try:
+            refused = self._smtp.sendmail(self.sender_email, to_addrs, message, mail_options)
+        except smtplib.SMTPServerDisconnected:
+            # The session went stale between messages: reconnect and retry once
+            logger.warning("SMTP server disconnected, reconnecting")
+            self._reconnect()
+            refused = self._smtp.sendmail(self.sender_email, to_addrs, message, mail_options)
+        
+        self._connection_sends += 1
+        return refused
+    
+    def send_email(self, to_addr: str, message: bytes) -> bool:
+        """Send a single email over the persistent SMTP session."""
+        try:
+            self._deliver(message, to_addr)
+            logger.info("Email sent successfully to %s", to_addr)
+            return True
                 
         except smtplib.SMTPAuthenticationError:
-            logger.error(f"Authentication failed for {self.sender_email}")
+            logger.error("Authentication failed for %s", self.sender_email)
             return False
         except smtplib.SMTPRecipientsRefused:
-            logger.error(f"Recipient refused: {msg['To']}")
+            logger.error("Recipient refused: %s", to_addr)
             return False
         except smtplib.SMTPServerDisconnected:
             logger.error("SMTP server disconnected")
+            self.close()
             return False
         except Exception as e:
-            logger.error(f"Error sending email to {msg['To']}: {str(e)}")
+            logger.error("Error sending email to %s: %s", to_addr, e)
             return False
     
-    def load_recipients(self, recipients_file: str) -> List[Dict]:
-        """Load recipients from CSV file."""
-        recipients = []
+    def send_bulk_email(self, message: bytes, to_addrs: List[str]) -> int:
+        """Send one email to several recipients in a single SMTP transaction.
+        
+        Returns the number of recipients the server accepted.
+        """
+        try:
+            refused = self._deliver(message, to_addrs)
+        except smtplib.SMTPAuthenticationError:
+            logger.error("Authentication failed for %s", self.sender_email)
+            return 0
+        except smtplib.SMTPRecipientsRefused:
+            logger.error("All %d recipients refused", len(to_addrs))
+            return 0
+        except smtplib.SMTPServerDisconnected:
+            logger.error("SMTP server disconnected")
+            self.close()
+            return 0
+        except Exception as e:
+            logger.error("Error sending email to %d recipients: %s", len(to_addrs), e)
+            return 0
+        
+        for addr in refused:
+            logger.error("Recipient refused: %s", addr)
+        accepted = len(to_addrs) - len(refused)
+        logger.info("Email sent successfully to %d recipients", accepted)
+        return accepted
+    
+    def _rotate_connection(self, max_emails_per_connection: int):
+        """Close the session once it has carried max_emails_per_connection emails."""
+        # Providers cap messages per connection; rotate before hitting the cap
+        if self._connection_sends >= max_emails_per_connection:
+            logger.info("Sent %d emails on this connection. Reconnecting...", self._connection_sends)
+            self.close()
+    
+    def open_recipients(self, recipients_file: str) -> _RecipientReader:
+        """Open the recipients CSV file for reading one row at a time."""
         try:
-            with open(recipients_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    recipients.append(row)
-            logger.info(f"Loaded {len(recipients)} recipients from {recipients_file}")
-            return recipients
+            return _RecipientReader(recipients_file)
         except FileNotFoundError:
-            logger.error(f"Recipients file {recipients_file} not found")
+            logger.error("Recipients file %s not found", recipients_file)
             raise
         except Exception as e:
-            logger.error(f"Error loading recipients: {str(e)}")
+            logger.error("Error loading recipients: %s", e)
             raise
     
     def send_cold_emails(self, recipients_file: str, dry_run: bool = False):
         """Send cold emails to all recipients."""
-        recipients = self.load_recipients(recipients_file)
-        template = self.config.get('template', {})
-        
-        if not template.get('subject') or not template.get('body'):
-            raise ValueError("Email template must include 'subject' and 'body'")
+        if self.account_index is None and len(self.accounts) > 1:
+            return self._send_with_all_accounts(recipients_file, dry_run)
         
         # Rate limiting settings
         min_delay = self.config.get('rate_limiting', {}).get('min_delay_seconds', 30)
         max_delay = self.config.get('rate_limiting', {}).get('max_delay_seconds', 60)
         max_emails_per_hour = self.config.get('rate_limiting', {}).get('max_emails_per_hour', 50)
+        rate_limiter = _RateLimiter(min_delay, max_delay, max_emails_per_hour, self._stop)
+        max_emails_per_connection = self.config.get('rate_limiting', {}).get('max_emails_per_connection', 1000)
+        batch_size = self.config.get('rate_limiting', {}).get('batch_size', 50)
+        
+        self._stop.clear()
+        with self._stop_on_interrupt(), self.open_recipients(recipients_file) as recipients:
+            self.compile_template(self.config.get('template', {}), recipients.fieldnames)
+            
+            logger.info("Starting cold email campaign to recipients in %s", recipients_file)
+            if self.account_index is not None:
+                # Worker of a multi-account campaign: take every Nth recipient
+                logger.info("Sending as %s (account %d of %d)",
+                            self.sender_email, self.account_index + 1, len(self.accounts))
+                recipients = islice(recipients, self.account_index, None, len(self.accounts))
+            if dry_run:
+                logger.info("DRY RUN MODE - No emails will be sent")
+            
+            if self._personalized or dry_run:
+                sent_count, failed_count = self._send_individually(
+                    recipients, rate_limiter, max_emails_per_connection, dry_run
+                )
+            else:
+                # Every recipient gets the identical email, so send it in batches
+                sent_count, failed_count = self._send_batches(
+                    recipients, rate_limiter, min(batch_size, max_emails_per_hour), max_emails_per_connection
+                )
+        
+        self.close()
+        if self._stop.is_set():
+            logger.info("Campaign stopped early.")
+        logger.info("Campaign completed. Sent: %d, Failed: %d", sent_count, failed_count)
+        # Write out the log lines still buffered for cold_emailer.log
+        _log_buffer.flush()
+        return sent_count, failed_count
+    
+    def _send_with_all_accounts(self, recipients_file: str, dry_run: bool):
+        """Split the campaign round-robin across the sender accounts.
+        
+        Each account runs in its own process with its own SMTP session and
+        rate limits, since providers limit each account separately.
+        """
+        jobs = [
+            (self.config_file, account_index, recipients_file, dry_run)
+            for account_index in range(len(self.accounts))
+        ]
+        logger.info("Splitting campaign across %d sender accounts", len(jobs))
+        
+        # The workers handle Ctrl-C themselves; keep this process waiting
+        # for them instead of tearing the pool down. A second Ctrl-C raises
+        # KeyboardInterrupt out of map(), and leaving the with block
+        # terminates the workers
+        with self._stop_on_interrupt():
+            with multiprocessing.get_context('spawn').Pool(len(jobs)) as pool:
+                results = pool.map(_run_account, jobs, chunksize=1)
         
+        sent_count = sum(sent for sent, _ in results)
+        failed_count = sum(failed for _, failed in results)
+        logger.info("Campaign completed. Sent: %d, Failed: %d", sent_count, failed_count)
+        # Write out the log lines still buffered for cold_emailer.log
+        _log_buffer.flush()
+        return sent_count, failed_count
+    
+    @contextlib.contextmanager
+    def _stop_on_interrupt(self):
+        """Turn Ctrl-C into a request to stop once the current email is sent."""
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        
+        def handle_sigint(signum, frame):
+            logger.warning("Interrupted. Stopping after the current email (Ctrl-C again to quit now)...")
+            self._stop.set()
+            # A second Ctrl-C gets the previous behaviour back, e.g. to
+            # abandon an email stuck on an unresponsive server
+            signal.signal(signal.SIGINT, previous_handler)
+        
+        previous_handler = signal.signal(signal.SIGINT, handle_sigint)
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+    
+    def _send_individually(self, recipients: Iterator[tuple], rate_limiter: _RateLimiter,
+                           max_emails_per_connection: int, dry_run: bool):
+        """Send each recipient their own personalized email."""
         sent_count = 0
         failed_count = 0
+        # Decided once, not per recipient
+        process = self._log_dry_run if dry_run else self._send_personalized
         
-        logger.info(f"Starting cold email campaign to {len(recipients)} recipients")
-        if dry_run:
-            logger.info("DRY RUN MODE - No emails will be sent")
-        
-        for i, recipient in enumerate(recipients):
+        for number, recipient in enumerate(recipients, start=1):
+            if dry_run:
+                # A dry run contacts no server, so it isn't rate limited
+                if self._stop.is_set():
+                    break
+            # Rate limiting; the first email goes out without waiting
+            elif not rate_limiter.wait():
+                break
+            
             try:
-                logger.info(f"Processing {i+1}/{len(recipients)}: {recipient.get('email', 'Unknown')}")
-                
-                if not dry_run:
-                    msg = self.create_email_message(recipient, template)
-                    success = self.send_email(msg)
-                    
-                    if success:
-                        sent_count += 1
-                    else:
-                        failed_count += 1
-                else:
-                    # Dry run - just log what would be sent
-                    msg = self.create_email_message(recipient, template)
-                    logger.info(f"DRY RUN: Would send to {msg['To']} with subject: {msg['Subject']}")
+                logger.info("Processing %d: %s", number, recipient[self._email_index])
+                if process(recipient):
                     sent_count += 1
-                
-                # Rate limiting
-                if i < len(recipients) - 1:  # Don't delay after the last email
-                    delay = random.uniform(min_delay, max_delay)
-                    logger.info(f"Waiting {delay:.1f} seconds before next email...")
-                    time.sleep(delay)
-                
-                # Hourly limit check
-                if (i + 1) % max_emails_per_hour == 0 and i < len(recipients) - 1:
-                    logger.info(f"Reached hourly limit ({max_emails_per_hour}). Waiting 1 hour...")
-                    time.sleep(3600)  # Wait 1 hour
+                else:
+                    failed_count += 1
+                self._rotate_connection(max_emails_per_connection)
                 
             except Exception as e:
-                logger.error(f"Error processing recipient {recipient.get('email', 'Unknown')}: {str(e)}")
+                logger.error("Error processing recipient %s: %s", recipient[self._email_index], e)
                 failed_count += 1
         
-        logger.info(f"Campaign completed. Sent: {sent_count}, Failed: {failed_count}")
         return sent_count, failed_count
+    
+    def _send_personalized(self, recipient: tuple) -> bool:
+        """Build and send one recipient's email."""
+        message = self.create_email_message(recipient)
+        return self.send_email(recipient[self._email_index], message)
+    
+    def _log_dry_run(self, recipient: tuple) -> bool:
+        """Log what would be sent; the body is never built."""
+        subject = self._subject_tmpl.render(recipient)
+        logger.info("DRY RUN: Would send to %s with subject: %s", recipient[self._email_index], subject)
+        return True
+    
+    def _send_batches(self, recipients: Iterator[tuple], rate_limiter: _RateLimiter,
+                      batch_size: int, max_emails_per_connection: int):
+        """Send one unpersonalized email to recipients, batch_size per SMTP transaction."""
+        # Recipients are only listed on the envelope, like BCC, so nobody
+        # sees the rest of the list
+        message = self.create_email_message((), to_addr='undisclosed-recipients:;')
+        recipients = iter(recipients)
+        sent_count = 0
+        failed_count = 0
+        
+        while True:
+            batch = list(islice(recipients, batch_size))
+            if not batch:
+                break
+            
+            to_addrs = []
+            for recipient in batch:
+                if recipient[self._email_index]:
+                    to_addrs.append(recipient[self._email_index])
+                else:
+                    logger.error("Skipping recipient without an email address: %s", recipient)
+                    failed_count += 1
+            if not to_addrs:
+                continue
+            
+            if not rate_limiter.wait(len(to_addrs)):
+                break
+            logger.info("Processing batch of %d: %s", len(to_addrs), ', '.join(to_addrs))
+            accepted = self.send_bulk_email(message, to_addrs)
+            sent_count += accepted
+            failed_count += len(to_addrs) - accepted
+            self._rotate_connection(max_emails_per_connection)
+        
+        return sent_count, failed_count
+
+def _run_account(job):
+    """Run one sender account's share of a campaign in a worker process."""
+    config_file, account_index, recipients_file, dry_run = job
+    # Every process appends to the same cold_emailer.log; write records as
+    # they happen so the file stays in order across workers
+    _log_buffer.capacity = 1
+    emailer = ColdEmailer(config_file, account_index)
+    return emailer.send_cold_emails(recipients_file, dry_run)
 
 def create_sample_config():
     """Create a sample configuration file."""
@@ -240,7 +770,9 @@ Best regards,
         "rate_limiting": {
             "min_delay_seconds": 30,
             "max_delay_seconds": 60,
-            "max_emails_per_hour": 50
+            "max_emails_per_hour": 50,
+            "max_emails_per_connection": 1000,
+            "batch_size": 50
         }
     }
     
@@ -313,7 +845,7 @@ def main():
         print(f"Emails failed: {failed}")
         
     except Exception as e:
-        logger.error(f"Campaign failed: {str(e)}")
+        logger.error("Campaign failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":